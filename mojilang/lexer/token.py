@@ -5,6 +5,9 @@ class Token:
     A token consists of a type, a lexeme (the string representation of the token),
     an optional literal value (such as a number or string), and the line number
     where the token appears in the source code.
+
+    The token type is a public attribute so the parser's hot paths can read it directly
+    instead of calling get_token_type().
     """
 
     def __init__(self, token_type, lexeme, literal, line):
@@ -16,7 +19,7 @@ class Token:
         :param literal: The literal value of the token (if applicable), such as a number or string.
         :param line: The line number where the token appears in the source code.
         """
-        self._token_type = token_type
+        self.type = token_type
         self._lexeme = lexeme
         self._literal = literal
         self._line = line
@@ -27,10 +30,10 @@ class Token:
 
         :return: A formatted string containing the token type, lexeme, and literal value.
         """
-        return f'|{self._token_type} {self._lexeme} {self._literal}|'
+        return f'|{self.type} {self._lexeme} {self._literal}|'
 
     def get_token_type(self):
-        return self._token_type
+        return self.type
 
     def get_line(self):
         return self._line
@@ -48,4 +51,4 @@ class Token:
         :param token_type: The type to compare against the token's type.
         :return: True if the token matches the specified type, False otherwise.
         """
-        return self._token_type == token_type
+        return self.type == token_type
@@ -1,74 +1,82 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
     """
-    The TokenType Enum defines all possible token types in mojilang.
+    The TokenType IntEnum defines all possible token types in mojilang.
 
     These include single-character tokens (such as parentheses, braces, and operators),
     multi-character tokens (such as comparison operators), literals (like numbers and strings),
     and keywords (such as 'if', 'loop', 'print', etc.).
-    Each token type is represented by a string name that corresponds to the type of token.
+    Each token type is represented by a small integer so that token type comparisons and
+    set lookups hash and compare as plain ints.
     """
 
     # Single character tokens
-    LEFT_PAREN = 'LEFT_PAREN'
-    RIGHT_PAREN = 'RIGHT_PAREN'
-    LEFT_BRACE = 'LEFT_BRACE'
-    RIGHT_BRACE = 'RIGHT_BRACE'
-    SEMI_COLON = 'SEMI_COLON'
-    PLUS = 'PLUS'
-    MINUS = 'MINUS'
-    MULTIPLY = 'MULTIPLY'
-    DIVIDE = 'DIVIDE'
-    MODULUS = 'MODULUS'
-    EXPONENT = 'EXPONENT'
-    COMMA = 'COMMA'
-    PERIOD = 'PERIOD'
+    LEFT_PAREN = 1
+    RIGHT_PAREN = 2
+    LEFT_BRACE = 3
+    RIGHT_BRACE = 4
+    SEMI_COLON = 5
+    PLUS = 6
+    MINUS = 7
+    MULTIPLY = 8
+    DIVIDE = 9
+    MODULUS = 10
+    EXPONENT = 11
+    COMMA = 12
+    PERIOD = 13
 
     # One or two character tokens
-    BANG = 'BANG'
-    BANG_EQUAL = 'BANG_EQUAL'
-    EQUAL = 'EQUAL'
-    EQUAL_EQUAL = 'EQUAL_EQUAL'
-    GREATER = 'GREATER'
-    GREATER_EQUAL = 'GREATER_EQUAL'
-    LESS = 'LESS'
-    LESS_EQUAL = 'LESS_EQUAL'
+    BANG = 14
+    BANG_EQUAL = 15
+    EQUAL = 16
+    EQUAL_EQUAL = 17
+    GREATER = 18
+    GREATER_EQUAL = 19
+    LESS = 20
+    LESS_EQUAL = 21
 
     # Literals
-    IDENTIFIER = 'IDENTIFIER'
-    STRING = 'STRING'
-    NUMBER = 'NUMBER'
+    IDENTIFIER = 22
+    STRING = 23
+    NUMBER = 24
 
     # Keywords
-    AND = 'AND'
-    ELSE = 'ELSE'
-    ELSEIF = 'ELSEIF'
-    FALSE = 'FALSE'
-    LOOP = 'LOOP'
-    IF = 'IF'
-    OR = 'OR'
-    PRINT = 'PRINT'
-    INPUT = 'INPUT'
-    RETURN = 'RETURN'
-    TRUE = 'TRUE'
-    VAR = 'VAR'
-    FUNCTION = 'FUNCTION'
-    FUNCTION_CALL = 'FUNCTION_CALL'
-    BREAK = 'BREAK'
-    CONTINUE = 'CONTINUE'
-
-    EOF = 'EOF'
+    AND = 25
+    ELSE = 26
+    ELSEIF = 27
+    FALSE = 28
+    LOOP = 29
+    IF = 30
+    OR = 31
+    PRINT = 32
+    INPUT = 33
+    RETURN = 34
+    TRUE = 35
+    VAR = 36
+    FUNCTION = 37
+    FUNCTION_CALL = 38
+    BREAK = 39
+    CONTINUE = 40
+
+    EOF = 41
+
+    def __str__(self):
+        """Keeps token types readable (e.g. TokenType.PLUS) in error messages instead of printing the int."""
+        return f'{self.__class__.__name__}.{self.name}'
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
 
     @classmethod
     def literal_types(cls):
         """
         Returns a set of token types that represent literal values in mojilang.
 
-        :return: A set containing NUMBER, STRING, TRUE, and FALSE token types.
+        :return: A frozenset containing NUMBER, STRING, TRUE, and FALSE token types.
         """
-        return {cls.NUMBER, cls.STRING, cls.TRUE, cls.FALSE}
+        return _LITERAL_TYPES
 
     @classmethod
     def valid_print_types(cls):
@@ -76,9 +84,9 @@ class TokenType(Enum):
         Returns a set of token types that are valid for print statements in mojilang.
         This includes identifiers and literal types.
 
-        :return: A set containing IDENTIFIER and all literal token types.
+        :return: A frozenset containing IDENTIFIER and all literal token types.
         """
-        return {cls.IDENTIFIER} | cls.literal_types()
+        return _VALID_PRINT_TYPES
 
     @classmethod
     def operation_types(cls):
@@ -86,9 +94,9 @@ class TokenType(Enum):
         Returns a set of token types that represent valid operations in mojilang.
         These include arithmetic operators, comparison operators, and logical operators.
 
-        :return: A set of token types representing valid operations.
+        :return: A frozenset of token types representing valid operations.
         """
-        return {cls.MULTIPLY, cls.DIVIDE, cls.PLUS, cls.MINUS, cls.MODULUS, cls.EXPONENT, cls.BANG, cls.BANG_EQUAL, cls.EQUAL_EQUAL, cls.LESS, cls.LESS_EQUAL, cls.GREATER, cls.GREATER_EQUAL, cls.AND, cls.OR}
+        return _OPERATION_TYPES
 
     @classmethod
     def unary_operations(cls):
@@ -96,9 +104,9 @@ class TokenType(Enum):
         Returns a set of token types that represent valid unary operations in mojilang.
         Unary operations operate on a single operand (e.g., logical negation).
 
-        :return: A set containing unary operators.
+        :return: A frozenset containing unary operators.
         """
-        return {cls.BANG}
+        return _UNARY_OPERATIONS
 
     @classmethod
     def valid_expression_types(cls):
@@ -106,10 +114,25 @@ class TokenType(Enum):
         Returns a set of token types that are valid within an expression in mojilang.
         This includes valid print types, operations, and parentheses.
 
-        :return: A set containing valid token types for expressions.
+        :return: A frozenset containing valid token types for expressions.
         """
-        return cls.valid_print_types() | cls.operation_types() | {cls.LEFT_PAREN, cls.RIGHT_PAREN, cls.COMMA, cls.FUNCTION_CALL}
+        return _VALID_EXPRESSION_TYPES
 
     @classmethod
     def if_statement_tokens(cls):
-        return {cls.IF, cls.ELSEIF, cls.ELSE}
+        return _IF_STATEMENT_TOKENS
+
+
+# The token type groupings never change, so they are built once at import time instead of on every call.
+_LITERAL_TYPES = frozenset({TokenType.NUMBER, TokenType.STRING, TokenType.TRUE, TokenType.FALSE})
+_VALID_PRINT_TYPES = _LITERAL_TYPES | {TokenType.IDENTIFIER}
+_OPERATION_TYPES = frozenset({
+    TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.PLUS, TokenType.MINUS, TokenType.MODULUS, TokenType.EXPONENT,
+    TokenType.BANG, TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL, TokenType.LESS, TokenType.LESS_EQUAL,
+    TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.AND, TokenType.OR
+})
+_UNARY_OPERATIONS = frozenset({TokenType.BANG})
+_VALID_EXPRESSION_TYPES = _VALID_PRINT_TYPES | _OPERATION_TYPES | {
+    TokenType.LEFT_PAREN, TokenType.RIGHT_PAREN, TokenType.COMMA, TokenType.FUNCTION_CALL
+}
+_IF_STATEMENT_TOKENS = frozenset({TokenType.IF, TokenType.ELSEIF, TokenType.ELSE})
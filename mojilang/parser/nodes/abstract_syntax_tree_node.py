@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class AbstractSyntaxTreeNode(ABC):
+    __slots__ = ('_line_number',)
+
     def __init__(self, line_number):
         self._line_number = line_number
 
@@ -3,6 +3,8 @@ from mojilang.parser.runtime_exception import RuntimeException
 
 
 class AssignmentNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_variable_node', '_value_node')
+
     def __init__(self, variable_node, value_node, line_number):
         super().__init__(line_number)
         self._variable_node = variable_node
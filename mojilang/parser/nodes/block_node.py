@@ -6,6 +6,8 @@ from mojilang.parser.scope.block_scope import BlockScope
 
 
 class BlockNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_nodes', '_block_scope_context')
+
     def __init__(self, nodes, block_scope_context, line_number):
         super().__init__(line_number)
         self._nodes = nodes
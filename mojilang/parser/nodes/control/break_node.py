@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class BreakNode(AbstractSyntaxTreeNode):
+    __slots__ = ()
+
     def __init__(self, line_number):
         super().__init__(line_number)
 
@@ -10,6 +10,8 @@ class ConditionalNode(AbstractSyntaxTreeNode):
     it delegates evaluation to the next conditional node, if it's present.
     """
 
+    __slots__ = ('_condition_node', '_block_node', '_next_conditional_node')
+
     def __init__(self, condition_node, block_node, next_conditional_node, line_number):
         """
         Initializes the ConditionalNode.
@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class ElseNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_block_node',)
+
     def __init__(self, block_node, line_number):
         super().__init__(line_number)
         self._block_node = block_node
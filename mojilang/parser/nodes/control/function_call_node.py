@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class FunctionCallNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_function_name', '_arguments')
+
     def __init__(self, function_name, arguments, line_number):
         super().__init__(line_number)
         self._function_name = function_name
@@ -3,6 +3,8 @@ from mojilang.parser.nodes.callable import Callable
 
 
 class FunctionNode(AbstractSyntaxTreeNode, Callable):
+    __slots__ = ('_function_name', '_argument_names', '_function_block_node')
+
     def __init__(self, function_name, argument_names, function_block_node, line_number):
         super().__init__(line_number)
         self._function_name = function_name
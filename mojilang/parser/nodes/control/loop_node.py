@@ -4,6 +4,8 @@ from mojilang.parser.nodes.control.continue_node import ContinueNode
 
 
 class LoopNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_condition_node', '_block_node')
+
     def __init__(self, condition_node, block_node, line_number):
         super().__init__(line_number)
         self._condition_node = condition_node
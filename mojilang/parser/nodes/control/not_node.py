@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class NotNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_condition_node',)
+
     def __init__(self, condition_node, line_number):
         super().__init__(line_number)
         self._condition_node = condition_node
@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class ReturnNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_return_value_node',)
+
     def __init__(self, return_value_node, line_number):
         super().__init__(line_number)
         self._return_value_node = return_value_node
@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class InputNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_input_message',)
+
     def __init__(self, input_message, line_number):
         super().__init__(line_number)
         self._input_message = input_message
@@ -1,4 +1,6 @@
 class BinaryOperationContext:
+    __slots__ = ('_left_operand', '_right_operand')
+
     def __init__(self, left_operand, right_operand):
         self._left_operand = left_operand
         self._right_operand = right_operand
@@ -2,6 +2,8 @@ from mojilang.parser.nodes.operation.operation_node import OperationNode
 
 
 class DivisionNode(OperationNode):
+    __slots__ = ()
+
     def __init__(self, left_operand, right_operand, line_number):
         super().__init__(left_operand, right_operand, '/', line_number)
 
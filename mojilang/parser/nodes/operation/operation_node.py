@@ -3,6 +3,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class OperationNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_left_operand', '_right_operand', 'value')
+
     def __init__(self, left_operand, right_operand, value, line_number):
         super().__init__(line_number)
         self._left_operand = left_operand
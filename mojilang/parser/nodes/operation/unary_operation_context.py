@@ -1,4 +1,6 @@
 class UnaryOperationContext:
+    __slots__ = ('_operand',)
+
     def __init__(self, operand):
         self._operand = operand
 
@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class PrintNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_node_to_print',)
+
     def __init__(self, node_to_print, line_number):
         super().__init__(line_number)
         self._node_to_print = node_to_print
@@ -3,6 +3,8 @@ from mojilang.parser.runtime_exception import RuntimeException
 
 
 class ReassignmentNode(AssignmentNode):
+    __slots__ = ()
+
     def __init__(self, variable_node, value_node, line_number):
         super().__init__(variable_node, value_node, line_number)
 
@@ -3,6 +3,8 @@ from mojilang.lexer import SyntaxException
 
 
 class VariableNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_name',)
+
     def __init__(self, name, line_number):
         super().__init__(line_number)
         self._name = name
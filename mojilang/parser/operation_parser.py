@@ -17,6 +17,27 @@ from mojilang.parser.nodes import (
     OrNode,
 )
 
+BINARY_OPERATIONS = {
+    TokenType.AND: AndNode,
+    TokenType.BANG_EQUAL: NotEqualsNode,
+    TokenType.DIVIDE: DivisionNode,
+    TokenType.EQUAL_EQUAL: EqualsNode,
+    TokenType.EXPONENT: ExponentNode,
+    TokenType.GREATER: GreaterNode,
+    TokenType.GREATER_EQUAL: GreaterEqualsNode,
+    TokenType.LESS: LessNode,
+    TokenType.LESS_EQUAL: LessEqualsNode,
+    TokenType.MINUS: SubtractionNode,
+    TokenType.MODULUS: ModulusNode,
+    TokenType.MULTIPLY: MultiplicationNode,
+    TokenType.OR: OrNode,
+    TokenType.PLUS: AdditionNode,
+}
+
+UNARY_OPERATIONS = {
+    TokenType.BANG: NotNode,
+}
+
 
 class OperationParser:
     """
@@ -34,28 +55,11 @@ class OperationParser:
         :param context: The context (unary or binary) in which the operation occurs.
         :return: The corresponding operation node.
         """
-        binary_operation_map = {
-            TokenType.AND: AndNode,
-            TokenType.BANG_EQUAL: NotEqualsNode,
-            TokenType.DIVIDE: DivisionNode,
-            TokenType.EQUAL_EQUAL: EqualsNode,
-            TokenType.EXPONENT: ExponentNode,
-            TokenType.GREATER: GreaterNode,
-            TokenType.GREATER_EQUAL: GreaterEqualsNode,
-            TokenType.LESS: LessNode,
-            TokenType.LESS_EQUAL: LessEqualsNode,
-            TokenType.MINUS: SubtractionNode,
-            TokenType.MODULUS: ModulusNode,
-            TokenType.MULTIPLY: MultiplicationNode,
-            TokenType.OR: OrNode,
-            TokenType.PLUS: AdditionNode,
-        }
-        token_type = token.get_token_type()
-        line_number = token.get_line()
-        if token_type in binary_operation_map:
-            operation_class = binary_operation_map[token_type]
-            left_operand, right_operand = context.get_left_operand(), context.get_right_operand()
-            return operation_class(left_operand, right_operand, line_number)
-
-        if token.is_token_type(TokenType.BANG):
-            return NotNode(context.get_operand(), line_number)
+        token_type = token.type
+        operation_class = BINARY_OPERATIONS.get(token_type)
+        if operation_class is not None:
+            return operation_class(context.get_left_operand(), context.get_right_operand(), token.get_line())
+
+        operation_class = UNARY_OPERATIONS.get(token_type)
+        if operation_class is not None:
+            return operation_class(context.get_operand(), token.get_line())
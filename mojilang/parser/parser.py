@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from mojilang.lexer import TokenType, SyntaxException
 from mojilang.parser.nodes import (
     AssignmentNode,
@@ -5,11 +7,8 @@ from mojilang.parser.nodes import (
     ElseIfNode,
     ElseNode,
     BlockNode,
-    NumberLiteralNode,
     PrintNode,
-    StringLiteralNode,
     VariableNode,
-    BooleanLiteralNode,
     ReassignmentNode,
     LoopNode,
     BreakNode,
@@ -22,7 +21,6 @@ from mojilang.parser.parser_state import ParserState
 from mojilang.parser.scope import BlockScopeContext, BlockScope
 from mojilang.parser.scope.block_scope_context_manager import BlockScopeContextManager
 from mojilang.parser.expression_parser import ExpressionParser
-from mojilang.parser.operation_parser import OperationParser
 
 
 class Parser:
@@ -30,8 +28,24 @@ class Parser:
     The Parser class is responsible for transforming a list of tokens into an Abstract Syntax Tree (AST).
     It handles parsing variable assignments, expressions, operations, and print statements.
     The algorithm used here to construct the AST is recursive descent parsing.
+
+    Parsed programs are cached by their token stream so feeding the same source again (e.g. in a REPL
+    or a test suite) reuses the AST. Sharing is safe because AST nodes are never mutated during evaluation.
+    Each cache key holds a tuple per token, so the cache is bounded by the total number of tokens it keeps
+    rather than by its number of entries, and programs larger than that budget are never cached.
+
+    Attributes:
+        _AST_CACHE (OrderedDict): Least recently used cache of parsed programs keyed by token stream fingerprint.
+        _AST_CACHE_MAX_TOKENS (int): The maximum number of tokens, summed over all cached programs, kept in the cache.
+        _ast_cache_token_count (int): The number of tokens currently held by the cache keys.
     """
 
+    __slots__ = ('_state', '_block_scope_context', '_expression_parser')
+
+    _AST_CACHE = OrderedDict()
+    _AST_CACHE_MAX_TOKENS = 100_000
+    _ast_cache_token_count = 0
+
     def __init__(self, tokens):
         """
         Initializes the parser with a list of tokens.
@@ -42,7 +56,6 @@ class Parser:
         self._block_scope_context = BlockScopeContext(BlockScope.GLOBAL)
 
         self._expression_parser = ExpressionParser(self)
-        self._operation_parser = OperationParser()
 
     def parse(self):
         """
@@ -51,51 +64,96 @@ class Parser:
 
         :return: BlockNode representing the entire parsed program.
         """
-        line_number = self._state.current_line_number()
+        if len(self._state.get_token_types()) > Parser._AST_CACHE_MAX_TOKENS:
+            return self._parse_program()
+
+        cache_key = self._state.fingerprint()
+        cached_abstract_syntax_tree = Parser._AST_CACHE.get(cache_key)
+        if cached_abstract_syntax_tree is not None:
+            Parser._AST_CACHE.move_to_end(cache_key)
+            return cached_abstract_syntax_tree
+
+        abstract_syntax_tree = self._parse_program()
+        self._cache_abstract_syntax_tree(cache_key, abstract_syntax_tree)
+        return abstract_syntax_tree
+
+    @classmethod
+    def _cache_abstract_syntax_tree(cls, cache_key, abstract_syntax_tree):
+        """
+        Stores a parsed program in the cache, evicting the least recently used programs until the
+        cached token count fits within _AST_CACHE_MAX_TOKENS.
+
+        :param cache_key: The fingerprint of the program's token stream.
+        :param abstract_syntax_tree: The BlockNode of the parsed program.
+        """
+        token_count = len(cache_key)
+        cls._AST_CACHE[cache_key] = abstract_syntax_tree
+        cls._ast_cache_token_count += token_count
+        while cls._ast_cache_token_count > cls._AST_CACHE_MAX_TOKENS:
+            evicted_key, _ = cls._AST_CACHE.popitem(last=False)
+            cls._ast_cache_token_count -= len(evicted_key)
+
+    def _parse_program(self):
+        """
+        Parses every top-level statement in the token stream.
+
+        :return: BlockNode representing the entire parsed program.
+        """
+        state, handle_token = self._state, self.handle_token
+        line_number = state.current_line_number()
         nodes = []
-        while self._state.in_bounds(self._state.get_current()) and not self._state.is_eof_token():
-            node = self.handle_token()
+        while state.in_bounds(state.get_current()) and not state.is_eof_token():
+            node = handle_token()
             nodes.append(node)
         return BlockNode(nodes, self._block_scope_context, line_number)
 
-    def handle_token(self, index=None, context=None):
+    def handle_token(self, index=None):
         """
         Handles a token based on its type. This function delegates token-specific logic to
         different parsing methods (e.g., print, identifier, variable).
 
         :param index: The current token index (defaults to _current).
-        :param context: Context for operation nodes.
         :return: A parsed node corresponding to the token.
+        :raises SyntaxException: If no statement can start with the token.
         """
         if index is None:
             index = self._state.get_current()
-        token = self._state.retrieve_token(index)
-        if token.is_token_type(TokenType.PRINT):
+        token_type = self._state.get_token_types()[index]
+        if token_type == TokenType.PRINT:
             return self._parse_print_token()
-        if token.is_token_type(TokenType.IDENTIFIER):
+        if token_type == TokenType.IDENTIFIER:
             if self._is_reassignment_statement(index):
                 return self._parse_reassignment()
-            return self._parse_identifier_token(index)
-        if token.is_token_type(TokenType.VAR):
+            return self._parse_expression_statement()
+        if token_type == TokenType.VAR:
             return self._parse_var_token()
-        if token.is_token_type(TokenType.IF):
+        if token_type == TokenType.IF:
             return self._parse_if_statement()
-        if token.is_token_type(TokenType.BREAK):
+        if token_type == TokenType.BREAK:
             return self._parse_break()
-        if token.is_token_type(TokenType.CONTINUE):
+        if token_type == TokenType.CONTINUE:
             return self._parse_continue()
-        if token.is_token_type(TokenType.LOOP):
+        if token_type == TokenType.LOOP:
             return self._parse_loop()
-        if token.is_token_type(TokenType.FUNCTION):
+        if token_type == TokenType.FUNCTION:
             return self._parse_function_declaration()
-        if token.is_token_type(TokenType.RETURN):
+        if token_type == TokenType.RETURN:
             return self._parse_return()
-        if token.is_token_type(TokenType.FUNCTION_CALL):
-            return self._parse_function_call()
-        if token.get_token_type() in TokenType.literal_types():
-            return self._parse_literal(token)
-        if token.get_token_type() in TokenType.operation_types():
-            return self._operation_parser.parse(token, context)
+        if token_type == TokenType.FUNCTION_CALL or token_type in TokenType.literal_types():
+            return self._parse_expression_statement()
+        token = self._state.retrieve_token(index)
+        raise SyntaxException(token.get_line(), f'Unexpected token {token} at start of statement.')
+
+    def _parse_expression_statement(self):
+        """
+        Parses an expression used as a statement, such as a function call. The expected structure is:
+        <expression> ;
+
+        :return: The node of the parsed expression.
+        """
+        node = self._expression_parser.parse()
+        self._validate_token(TokenType.SEMI_COLON, "Expected ';' to terminate statement.")
+        return node
 
     def _parse_print_token(self):
         """
@@ -104,24 +162,24 @@ class Parser:
 
         :return: PrintNode representing the print statement.
         """
-        line_number = self._validate_token({TokenType.PRINT}, "Expected '🗣️' for print statement.")
+        line_number = self._validate_token(TokenType.PRINT, "Expected '🗣️' for print statement.")
         node_to_print = self._expression_parser.parse()
-        self._validate_token({TokenType.SEMI_COLON}, "Expected ';' to terminate statement.")
+        self._validate_token(TokenType.SEMI_COLON, "Expected ';' to terminate statement.")
         return PrintNode(node_to_print, line_number)
 
-    def _validate_token(self, valid_token_types, error_message):
+    def _validate_token(self, expected_token_type, error_message):
         """
-        Validates that the current token matches one of the expected types. Raises a SyntaxException if not.
+        Validates that the current token matches the expected type. Raises a SyntaxException if not.
 
-        :param valid_token_types: A set of token types that are valid while parsing this token.
+        :param expected_token_type: The token type that is valid while parsing this token.
         :param error_message: The error message to raise if validation fails.
+        :return: The line number of the validated token.
         """
         current_token = self._state.current_token()
-        token_line_number = current_token.get_line()
-        if current_token.get_token_type() not in valid_token_types:
-            raise SyntaxException(token_line_number, f'{error_message} was {current_token}')
+        if current_token.type != expected_token_type:
+            raise SyntaxException(current_token.get_line(), f'{error_message} was {current_token}')
         self._state.advance_current()
-        return token_line_number
+        return current_token.get_line()
 
     def _is_reassignment_statement(self, index):
         """
@@ -131,8 +189,8 @@ class Parser:
         :param index: The index of the identifier token.
         :return: if the statement is for variable reassignment.
         """
-        previous_token, next_token = self._state.retrieve_token(index - 1), self._state.retrieve_token(index + 1)
-        return next_token.is_token_type(TokenType.EQUAL) and not previous_token.is_token_type(TokenType.VAR)
+        token_types = self._state.get_token_types()
+        return token_types[index + 1] == TokenType.EQUAL and token_types[index - 1] != TokenType.VAR
 
     def _parse_identifier_token(self, index):
         """
@@ -165,10 +223,10 @@ class Parser:
         :raises: SyntaxException if the assignment statement is invalid, such as missing an identifier, assignment operator, or semicolon.
         """
         variable_node = self._parse_identifier_token(self._state.get_current())
-        line_number = self._validate_token({TokenType.IDENTIFIER}, "Expected an identifier for assignment.")
-        self._validate_token({TokenType.EQUAL}, "Expected '✍️' for assignment.")
+        line_number = self._validate_token(TokenType.IDENTIFIER, "Expected an identifier for assignment.")
+        self._validate_token(TokenType.EQUAL, "Expected '✍️' for assignment.")
         value_node = self._expression_parser.parse()
-        self._validate_token({TokenType.SEMI_COLON}, "Expected ';' to terminate the statement.")
+        self._validate_token(TokenType.SEMI_COLON, "Expected ';' to terminate the statement.")
         return variable_node, value_node, line_number
 
     def _parse_var_token(self):
@@ -178,7 +236,7 @@ class Parser:
 
         :return: AssignmentNode representing the variable assignment.
         """
-        self._validate_token({TokenType.VAR}, "Expected '🥸' to indicate variable.")
+        self._validate_token(TokenType.VAR, "Expected '🥸' to indicate variable.")
         variable_node, value_node, line_number = self._parse_assignment()
         return AssignmentNode(variable_node, value_node, line_number)
 
@@ -188,7 +246,7 @@ class Parser:
 
         :return: An IfNode representing the parsed if statement.
         """
-        line_number = self._validate_token({TokenType.IF}, "Expected '🤔' for if statement.")
+        line_number = self._validate_token(TokenType.IF, "Expected '🤔' for if statement.")
         condition_node, block_node = self._parse_conditional()
         next_conditional = self._parse_next_if_conditional()
         return IfNode(condition_node, block_node, next_conditional, line_number)
@@ -200,9 +258,9 @@ class Parser:
         :return: Tuple containing the condition node and block node.
         """
         condition_node = self._expression_parser.parse()
-        self._validate_token({TokenType.LEFT_BRACE}, "Expected '{' to begin if statement block.")
+        self._validate_token(TokenType.LEFT_BRACE, "Expected '{' to begin if statement block.")
         if_block_node = self._parse_block(BlockScope.CONDITIONAL)
-        self._validate_token({TokenType.RIGHT_BRACE}, "Expected '}' to begin if statement block.")
+        self._validate_token(TokenType.RIGHT_BRACE, "Expected '}' to begin if statement block.")
         return condition_node, if_block_node
 
     def _parse_block(self, block_scope):
@@ -212,32 +270,34 @@ class Parser:
 
         :return: A BlockNode representing the parsed block of code.
         """
-        line_number = self._state.current_line_number()
+        state, handle_token = self._state, self.handle_token
+        line_number = state.current_line_number()
         nodes = []
         with BlockScopeContextManager(self, self._block_scope_context, block_scope) as new_block_scope_context:
-            while not self._state.current_token().is_token_type(TokenType.RIGHT_BRACE):
-                if self._state.is_eof_token():
-                    raise SyntaxException(self._state.current_token().get_line(), "Missing closing right brace.")
-                node = self.handle_token()
+            while state.current_token_type() != TokenType.RIGHT_BRACE:
+                if state.is_eof_token():
+                    raise SyntaxException(state.current_line_number(), "Missing closing right brace.")
+                node = handle_token()
                 nodes.append(node)
             return BlockNode(nodes, new_block_scope_context, line_number)
 
     def _parse_next_if_conditional(self):
         """
-        Parses an optional elseif block chain in an if statement.
+        Parses an optional elseif block chain in an if statement. The elseif branches are collected
+        in a loop and then linked from the last one backwards, so long chains do not recurse.
 
         :return: A BlockNode representing the elseif node or None if not present.
         """
-        current_token = self._state.current_token()
-        if current_token.is_token_type(TokenType.ELSE):
-            return self._parse_else()
-        if current_token.get_token_type() not in TokenType.if_statement_tokens():
-            return
-        if current_token.is_token_type(TokenType.ELSEIF):
-            line_number = self._validate_token({TokenType.ELSEIF}, "Expected '🙈' for elseif statement.")
+        else_if_branches = []
+        while self._state.current_token_type() == TokenType.ELSEIF:
+            line_number = self._validate_token(TokenType.ELSEIF, "Expected '🙈' for elseif statement.")
             condition_node, block_node = self._parse_conditional()
-            next_conditional = self._parse_next_if_conditional()
-            return ElseIfNode(condition_node, block_node, next_conditional, line_number)
+            else_if_branches.append((condition_node, block_node, line_number))
+
+        next_conditional = self._parse_else()
+        for condition_node, block_node, line_number in reversed(else_if_branches):
+            next_conditional = ElseIfNode(condition_node, block_node, next_conditional, line_number)
+        return next_conditional
 
     def _parse_else(self):
         """
@@ -245,11 +305,11 @@ class Parser:
 
         :return: A BlockNode representing the else block or None if no else block is present.
         """
-        if self._state.current_token().is_token_type(TokenType.ELSE):
-            line_number = self._validate_token({TokenType.ELSE}, "Expected '💅' for else.")
-            self._validate_token({TokenType.LEFT_BRACE}, "Expected '{' to begin else block.")
+        if self._state.current_token_type() == TokenType.ELSE:
+            line_number = self._validate_token(TokenType.ELSE, "Expected '💅' for else.")
+            self._validate_token(TokenType.LEFT_BRACE, "Expected '{' to begin else block.")
             else_block_node = self._parse_block(BlockScope.CONDITIONAL)
-            self._validate_token({TokenType.RIGHT_BRACE}, "Expected '}' to begin else block.")
+            self._validate_token(TokenType.RIGHT_BRACE, "Expected '}' to begin else block.")
             return ElseNode(else_block_node, line_number)
 
     def _parse_break(self):
@@ -259,8 +319,8 @@ class Parser:
         :return: A BreakNode representing the break.
         :raise: SyntaxException if the '💥' token or the terminating semicolon is missing.
         """
-        line_number = self._validate_token({TokenType.BREAK}, "Expected '💥' for break.")
-        self._validate_token({TokenType.SEMI_COLON}, "Expected ';' to terminate statement.")
+        line_number = self._validate_token(TokenType.BREAK, "Expected '💥' for break.")
+        self._validate_token(TokenType.SEMI_COLON, "Expected ';' to terminate statement.")
         return BreakNode(line_number)
 
     def _parse_continue(self):
@@ -270,8 +330,8 @@ class Parser:
         :return: A ContinueNode representing the continue.
         :raise: SyntaxException if the '🤓' token or the terminating semicolon is missing.
         """
-        line_number = self._validate_token({TokenType.CONTINUE}, "Expected '🤓' for continue.")
-        self._validate_token({TokenType.SEMI_COLON}, "Expected ';' to terminate statement.")
+        line_number = self._validate_token(TokenType.CONTINUE, "Expected '🤓' for continue.")
+        self._validate_token(TokenType.SEMI_COLON, "Expected ';' to terminate statement.")
         return ContinueNode(line_number)
 
     def _parse_loop(self):
@@ -280,11 +340,11 @@ class Parser:
 
         :return: An LoopNode representing the parsed loop.
         """
-        line_number = self._validate_token({TokenType.LOOP}, "Expected '🔁' for loop.")
+        line_number = self._validate_token(TokenType.LOOP, "Expected '🔁' for loop.")
         condition_node = self._expression_parser.parse()
-        self._validate_token({TokenType.LEFT_BRACE}, "Expected '{' to begin if statement block.")
+        self._validate_token(TokenType.LEFT_BRACE, "Expected '{' to begin if statement block.")
         loop_block_node = self._parse_block(BlockScope.LOOP)
-        self._validate_token({TokenType.RIGHT_BRACE}, "Expected '}' to begin if statement block.")
+        self._validate_token(TokenType.RIGHT_BRACE, "Expected '}' to begin if statement block.")
         return LoopNode(condition_node, loop_block_node, line_number)
 
     def _parse_function_declaration(self):
@@ -294,13 +354,13 @@ class Parser:
         :return: An FunctionNode representing the parsed function.
         :raises SyntaxException: If the function declaration is malformed (e.g. missing tokens).
         """
-        line_number = self._validate_token({TokenType.FUNCTION}, "Expected '🛠️' for function.")
+        line_number = self._validate_token(TokenType.FUNCTION, "Expected '🛠️' for function.")
         function_name = self._parse_function_name()
-        self._validate_token({TokenType.IDENTIFIER}, "Expected an identifier for function declaration.")
+        self._validate_token(TokenType.IDENTIFIER, "Expected an identifier for function declaration.")
         function_arguments = self._parse_function_argument_names()
-        self._validate_token({TokenType.LEFT_BRACE}, "Expected '{' to begin if statement block.")
+        self._validate_token(TokenType.LEFT_BRACE, "Expected '{' to begin if statement block.")
         function_block_node = self._parse_block(BlockScope.FUNCTION)
-        self._validate_token({TokenType.RIGHT_BRACE}, "Expected '}' to begin if statement block.")
+        self._validate_token(TokenType.RIGHT_BRACE, "Expected '}' to begin if statement block.")
         return FunctionNode(function_name, function_arguments, function_block_node, line_number)
 
     def _parse_function_name(self):
@@ -320,12 +380,12 @@ class Parser:
         :return: A list of argument names (as strings) for the function.
         :raises SyntaxException: If parentheses or arguments are not correctly formatted.
         """
-        self._validate_token({TokenType.LEFT_PAREN}, "Expected left parenthesis for function declaration.")
+        self._validate_token(TokenType.LEFT_PAREN, "Expected left parenthesis for function declaration.")
         arguments = []
-        while self._state.current_token().is_token_type(TokenType.VAR):
+        while self._state.current_token_type() == TokenType.VAR:
             argument = self._parse_function_argument_name()
             arguments.append(argument)
-        self._validate_token({TokenType.RIGHT_PAREN}, "Expected right parenthesis for function declaration.")
+        self._validate_token(TokenType.RIGHT_PAREN, "Expected right parenthesis for function declaration.")
         return arguments
 
     def _parse_function_argument_name(self):
@@ -335,11 +395,11 @@ class Parser:
         :return: A string representing the argument name.
         :raises SyntaxException: If the argument declaration is malformed.
         """
-        self._validate_token({TokenType.VAR}, "Expected '🥸' for function argument declaration.")
+        self._validate_token(TokenType.VAR, "Expected '🥸' for function argument declaration.")
         identifier_token = self._state.current_token()
-        self._validate_token({TokenType.IDENTIFIER}, "Expected an identifier for function argument declaration.")
-        if self._state.current_token().is_token_type(TokenType.COMMA):
-            self._validate_token({TokenType.COMMA}, "Expected a comma for function argument declaration.")
+        self._validate_token(TokenType.IDENTIFIER, "Expected an identifier for function argument declaration.")
+        if self._state.current_token_type() == TokenType.COMMA:
+            self._validate_token(TokenType.COMMA, "Expected a comma for function argument declaration.")
         return identifier_token.get_lexeme()
 
     def _parse_return(self):
@@ -349,21 +409,21 @@ class Parser:
         :return: A ReturnNode representing the return statement and the expression to return.
         :raises SyntaxException: If the return statement is missing or malformed.
         """
-        line_number = self._validate_token({TokenType.RETURN}, "Expected '🫡' for a function return.")
+        line_number = self._validate_token(TokenType.RETURN, "Expected '🫡' for a function return.")
         node_to_return = self._expression_parser.parse()
-        self._validate_token({TokenType.SEMI_COLON}, "Expected ';' to terminate statement.")
+        self._validate_token(TokenType.SEMI_COLON, "Expected ';' to terminate statement.")
         return ReturnNode(node_to_return, line_number)
 
-    def _parse_function_call(self):
+    def parse_function_call(self):
         """
         Parses a function call corresponding to '👀' token from the source code.
 
         :return: A FunctionCallNode representing the function call.
         :raises SyntaxException: If the function call is malformed.
         """
-        line_number = self._validate_token({TokenType.FUNCTION_CALL}, "Expected '👀' for a function call.")
+        line_number = self._validate_token(TokenType.FUNCTION_CALL, "Expected '👀' for a function call.")
         identifier_token = self._state.current_token()
-        self._validate_token({TokenType.IDENTIFIER}, "Expected an identifier for function call.")
+        self._validate_token(TokenType.IDENTIFIER, "Expected an identifier for function call.")
         arguments = self._parse_function_call_arguments()
         return FunctionCallNode(identifier_token.get_lexeme(), arguments, line_number)
 
@@ -374,33 +434,16 @@ class Parser:
         :return: A list of expression nodes representing the arguments to the function call.
         :raises SyntaxException: If the argument list is malformed or parentheses are unbalanced.
         """
-        self._validate_token({TokenType.LEFT_PAREN}, "Expected left parenthesis for function declaration.")
+        self._validate_token(TokenType.LEFT_PAREN, "Expected left parenthesis for function declaration.")
         arguments = []
-        while not self._state.current_token().is_token_type(TokenType.RIGHT_PAREN):
-            argument_node = self._expression_parser.parse({TokenType.COMMA, TokenType.RIGHT_PAREN})
+        while self._state.current_token_type() != TokenType.RIGHT_PAREN:
+            argument_node = self._expression_parser.parse_argument()
             arguments.append(argument_node)
-            if self._state.current_token().is_token_type(TokenType.COMMA):
-                self._validate_token({TokenType.COMMA}, "Expected a comma for function call argument.")
-        self._validate_token({TokenType.RIGHT_PAREN}, "Expected right parenthesis for function call.")
+            if self._state.current_token_type() != TokenType.RIGHT_PAREN:
+                self._validate_token(TokenType.COMMA, "Expected a comma for function call argument.")
+        self._validate_token(TokenType.RIGHT_PAREN, "Expected right parenthesis for function call.")
         return arguments
 
-    def _parse_literal(self, token):
-        """
-        Parses a literal token (e.g., string, number, boolean).
-
-        :param token: The literal token to parse.
-        :return: Node representing the literal value.
-        """
-        line_number = self._state.current_line_number()
-        if token.is_token_type(TokenType.STRING):
-            return StringLiteralNode(token.get_literal(), line_number)
-        if token.is_token_type(TokenType.NUMBER):
-            return NumberLiteralNode(token.get_literal(), line_number)
-        if token.is_token_type(TokenType.TRUE):
-            return BooleanLiteralNode(True, line_number)
-        if token.is_token_type(TokenType.FALSE):
-            return BooleanLiteralNode(False, line_number)
-
     def get_scope(self):
         return self._block_scope_context
 
@@ -10,6 +10,8 @@ class ParserState:
 
     Attributes:
         _tokens (list): A list of tokens generated by the lexer.
+        _token_types (list): The type of every token, parallel to _tokens, so type checks
+                             read a single list element instead of calling into each token.
         _current (int): The current index in the list of tokens.
     """
 
@@ -20,6 +22,7 @@ class ParserState:
         :param tokens: The list of tokens generated by the lexer.
         """
         self._tokens = tokens
+        self._token_types = [token.type for token in tokens]
         self._current = 0
 
     def current_line_number(self):
@@ -38,6 +41,14 @@ class ParserState:
         """
         return self.retrieve_token(self._current)
 
+    def current_token_type(self):
+        """
+        Retrieves the type of the current token being processed.
+
+        :return: The TokenType of the current token.
+        """
+        return self._token_types[self._current]
+
     def retrieve_token(self, index):
         """
         Retrieves the token at a specified index.
@@ -65,8 +76,7 @@ class ParserState:
 
         :return: True if the current token is EOF, False otherwise.
         """
-        token = self.current_token()
-        return token.is_token_type(TokenType.EOF)
+        return self._token_types[self._current] == TokenType.EOF
 
     def advance_current(self, steps=1):
         """
@@ -80,6 +90,18 @@ class ParserState:
         else:
             raise IndexError("Attempted to advance past the end of tokens")
 
+    def fingerprint(self):
+        """
+        Builds a hashable fingerprint of the token stream. Every token field the parser reads is part
+        of the fingerprint, so two streams with the same fingerprint produce the same AST, line numbers included.
+
+        :return: A tuple of (token type, lexeme, literal, line) for every token.
+        """
+        return tuple((token.type, token.get_lexeme(), token.get_literal(), token.get_line()) for token in self._tokens)
+
+    def get_token_types(self):
+        return self._token_types
+
     def get_current(self):
         return self._current
 
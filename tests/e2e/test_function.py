@@ -26,3 +26,29 @@ def test_multiple_sum_function_calls(capsys):
     expected_output = "8.0\n9.0\n"
     captured = run_interpreter_and_retrieve_output(source_code, capsys)
     assert captured.out == expected_output
+
+
+def test_function_call_with_parenthesized_argument(capsys):
+    source_code = """
+    🛠 sum(🥸 num1, 🥸 num2) {
+      🫡 num1 ➕ num2;
+    }
+
+    🗣️(👀sum((1 ➕ 2) ✖️ 2, 👀sum(1, 1)));
+    """
+    expected_output = "8.0\n"
+    captured = run_interpreter_and_retrieve_output(source_code, capsys)
+    assert captured.out == expected_output
+
+
+def test_function_call_statement(capsys):
+    source_code = """
+    🛠 greet(🥸 name) {
+      🗣️(name);
+    }
+
+    👀greet("Mojilang");
+    """
+    expected_output = "Mojilang\n"
+    captured = run_interpreter_and_retrieve_output(source_code, capsys)
+    assert captured.out == expected_output
@@ -1,5 +1,5 @@
 import pytest
-from mojilang.lexer import Lexer, SyntaxException
+from mojilang.lexer import Lexer, SyntaxException, Token, TokenType
 from mojilang.parser import Parser
 from mojilang.parser.nodes import (
     AdditionNode,
@@ -8,10 +8,22 @@ from mojilang.parser.nodes import (
     BlockNode,
     PrintNode,
     VariableNode,
-    MultiplicationNode
+    MultiplicationNode,
+    SubtractionNode,
+    ExponentNode,
+    NumberLiteralNode
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_ast_cache():
+    Parser._AST_CACHE.clear()
+    Parser._ast_cache_token_count = 0
+    yield
+    Parser._AST_CACHE.clear()
+    Parser._ast_cache_token_count = 0
+
+
 @pytest.fixture
 def lexer():
     def create_tokens(source_code):
@@ -86,3 +98,120 @@ def test_invalid_syntax(lexer):
 
     with pytest.raises(SyntaxException):
         parser.parse()
+
+
+def test_subtraction_is_left_associative(lexer):
+    source_code = "🥸 result ✍️ 10 ➖ 4 ➖ 3;"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+    ast = parser.parse()
+
+    value_node = ast.get_nodes()[0].get_value_node()
+    assert isinstance(value_node.get_left_operand(), SubtractionNode)
+    assert value_node.evaluate({}) == 3
+
+
+def test_exponent_is_right_associative(lexer):
+    source_code = "🥸 result ✍️ 2 🥕 3 🥕 2;"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+    ast = parser.parse()
+
+    value_node = ast.get_nodes()[0].get_value_node()
+    assert isinstance(value_node.get_right_operand(), ExponentNode)
+    assert value_node.evaluate({}) == 512
+
+
+def test_missing_closing_parenthesis(lexer):
+    source_code = "🗣️((3 ➕ 2);"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+
+    with pytest.raises(SyntaxException):
+        parser.parse()
+
+
+def test_missing_opening_parenthesis(lexer):
+    source_code = "🗣️(3 ➕ 2));"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+
+    with pytest.raises(SyntaxException, match="Right parenthesis missing corresponding left."):
+        parser.parse()
+
+
+def test_identical_programs_share_cached_ast(lexer):
+    source_code = "🥸 cached ✍️ 1 ➕ 2;"
+    first_ast = Parser(lexer(source_code)).parse()
+    second_ast = Parser(lexer(source_code)).parse()
+    different_ast = Parser(lexer("🥸 cached ✍️ 1 ➕ 3;")).parse()
+
+    assert first_ast is second_ast
+    assert different_ast is not first_ast
+
+
+def test_programs_differing_only_in_literal_do_not_share_cached_ast():
+    def create_tokens(literal):
+        return [
+            Token(TokenType.VAR, "🥸", None, 1),
+            Token(TokenType.IDENTIFIER, "number", None, 1),
+            Token(TokenType.EQUAL, "✍", None, 1),
+            Token(TokenType.NUMBER, "1", literal, 1),
+            Token(TokenType.SEMI_COLON, ";", None, 1),
+            Token(TokenType.EOF, "", None, 1),
+        ]
+
+    first_ast = Parser(create_tokens(1.0)).parse()
+    second_ast = Parser(create_tokens(5.0)).parse()
+
+    assert first_ast is not second_ast
+    assert second_ast.get_nodes()[0].get_value_node().evaluate({}) == 5.0
+
+
+def test_literal_statement(lexer):
+    source_code = "5;"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+    ast = parser.parse()
+
+    assert len(ast.get_nodes()) == 1
+    assert isinstance(ast.get_nodes()[0], NumberLiteralNode)
+
+
+def test_expression_statement_in_block(lexer):
+    source_code = "🤔(😤) { 1 ➕ 2; x; }"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+    ast = parser.parse()
+
+    block_nodes = ast.get_nodes()[0]._block_node.get_nodes()
+    assert isinstance(block_nodes[0], AdditionNode)
+    assert isinstance(block_nodes[1], VariableNode)
+
+
+def test_stray_semicolon(lexer):
+    source_code = "🥸 x ✍️ 5;;"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+
+    with pytest.raises(SyntaxException, match="start of statement"):
+        parser.parse()
+
+
+def test_function_call_arguments_missing_comma(lexer):
+    source_code = "🗣️(👀sum(1 2));"
+    tokens = lexer(source_code)
+    parser = Parser(tokens)
+
+    with pytest.raises(SyntaxException, match="Expected a comma"):
+        parser.parse()
+
+
+def test_programs_larger_than_cache_budget_are_not_cached(lexer, monkeypatch):
+    monkeypatch.setattr(Parser, "_AST_CACHE_MAX_TOKENS", 3)
+    source_code = "🥸 uncached ✍️ 1;"
+    first_ast = Parser(lexer(source_code)).parse()
+    second_ast = Parser(lexer(source_code)).parse()
+
+    assert first_ast is not second_ast
+    assert len(Parser._AST_CACHE) == 0